@@ -6,29 +6,94 @@ Food Ordering App - Full (Menu, Cart, Orders, Admin)
 """
 
 import sqlite3
-import pandas as pd
-import numpy as np
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime
 
 DB_FILE = 'projects.db'
+# Bumped whenever init_db's schema/seed data changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Statements run on every refresh/checkout. Keeping each as one constant
+# string means the per-connection prepared-statement cache (keyed on the SQL
+# text) always hits on the long-lived connections below.
+# (price comes back as text, ready for display)
+SQL_LOAD_FOOD = "SELECT foodid, foodname, CAST(price AS TEXT), quantity, foodavail FROM food WHERE foodavail='Available'"
+SQL_LOAD_DRINK = "SELECT drinkid, drinkname, CAST(price AS TEXT), quantity, drinkavail FROM drink WHERE drinkavail='Available'"
+SQL_CUSTOMER_EXISTS = 'SELECT COUNT(*) FROM customer WHERE custid=?'
+SQL_LOAD_DELIVERY = 'SELECT delid, delname, delcharge FROM delivery'
+SQL_INSERT_CUSTOMER = 'INSERT INTO customer (name, phone, address) VALUES (?,?,?)'
+SQL_INSERT_ORDER = 'INSERT INTO orders (totalcost, foodid, drinkid, delid) VALUES (?,?,?,?)'
+SQL_INSERT_PAYMENT = 'INSERT INTO payment (paymethod, custid, ordid) VALUES (?,?,?)'
+SQL_UPDATE_STOCK = 'UPDATE food SET quantity = MAX(0, IFNULL(quantity, 0) - ?) WHERE foodid=?'
+SQL_INSERT_FOOD = 'INSERT INTO food (foodid,foodname,price,quantity,foodavail,cuisineid,ingid,chefid) VALUES (?,?,?,?,?,?,?,?)'
+# Admin tab: fixed table -> query map, so each click reuses the same cached
+# statement and no table name is ever interpolated into SQL
+SQL_ADMIN_TABLES = {
+    'customer': 'SELECT * FROM customer',
+    'food': 'SELECT * FROM food',
+    'drink': 'SELECT * FROM drink',
+    'orders': 'SELECT * FROM orders',
+    'payment': 'SELECT * FROM payment',
+    'menu_food_v': 'SELECT * FROM menu_food_v',
+}
+
+# Alternate row colouring, indexed by 1-based row number & 1 (first row 'odd')
+ROW_TAGS = ('even', 'odd')
 
 # --------------------------
 # Database helpers
 # --------------------------
 
-def get_conn():
-    conn = sqlite3.connect(DB_FILE)
-    conn.execute('PRAGMA foreign_keys = ON;')
+# One writer + one read-only reader, both opened once, reused and only ever used
+# from the Tk thread. Admin-tab worker threads never touch them; each opens its
+# own short-lived read-only connection (open_read_conn). WAL lets readers run
+# alongside the writer, so menu/admin refreshes never wait on a checkout.
+_WRITER = None
+_READER = None
+
+def get_write_conn():
+    global _WRITER
+    if _WRITER is None:
+        _WRITER = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+        _WRITER.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -20000;
+        PRAGMA busy_timeout = 5000;
+        PRAGMA foreign_keys = ON;
+        """)
+    return _WRITER
+
+def open_read_conn():
+    # new read-only connection; the file must already exist in WAL mode
+    conn = sqlite3.connect(f'file:{DB_FILE}?mode=ro', uri=True,
+                           isolation_level=None, check_same_thread=False)
+    conn.executescript("""
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    PRAGMA busy_timeout = 5000;
+    """)
     return conn
 
-def init_db():
-    conn = get_conn()
-    cur = conn.cursor()
+def get_read_conn():
+    global _READER
+    if _READER is None:
+        get_write_conn()  # make sure the file exists and is in WAL mode first
+        _READER = open_read_conn()
+    return _READER
+
+def close_conn():
+    global _WRITER, _READER
+    for conn in (_READER, _WRITER):
+        if conn is not None:
+            conn.close()
+    _WRITER = _READER = None
 
-    # Create tables (ensure customer simplified schema)
-    cur.executescript(r"""
+# Full schema: tables (customer uses the simplified name/phone/address form),
+# menu indexes and views. Run by init_db only when user_version is behind.
+_SCHEMA_SQL = r"""
     CREATE TABLE IF NOT EXISTS customer (
         custid INTEGER PRIMARY KEY AUTOINCREMENT,
         name TEXT NOT NULL,
@@ -128,13 +193,73 @@ def init_db():
         FOREIGN KEY(custid) REFERENCES customer(custid) ON DELETE CASCADE,
         FOREIGN KEY(ordid) REFERENCES orders(ordid) ON DELETE CASCADE
     );
-    """)
-    conn.commit()
 
-    # helper to check if table empty
+    -- Partial covering indexes for the menu: only available items, with every
+    -- column load_menu reads, so the menu query is an index-only scan
+    CREATE INDEX IF NOT EXISTS idx_food_avail ON food(foodid, foodname, price, quantity, foodavail)
+        WHERE foodavail='Available';
+    CREATE INDEX IF NOT EXISTS idx_drink_avail ON drink(drinkid, drinkname, price, quantity, drinkavail)
+        WHERE drinkavail='Available';
+
+    -- Denormalized menu view with cuisine/chef names inlined, so readers get
+    -- them from one query instead of writing the joins themselves
+    DROP VIEW IF EXISTS menu_food_v;
+    CREATE VIEW menu_food_v AS
+        SELECT f.foodid, f.foodname, f.price, f.quantity, f.foodavail, c.cuisinename, ch.chefname
+        FROM food f
+        LEFT JOIN cuisine c ON c.cuisineid = f.cuisineid
+        LEFT JOIN chef ch ON ch.chefid = f.chefid;
+    """
+
+# v2: first/last name derived from customer.name as virtual generated columns
+# (split at the first space), so readers never split the string in Python
+_CUSTOMER_NAME_SQL = r"""
+    ALTER TABLE customer ADD COLUMN fname TEXT GENERATED ALWAYS AS (
+        CASE WHEN instr(name, ' ') > 0 THEN substr(name, 1, instr(name, ' ') - 1) ELSE name END
+    ) VIRTUAL;
+    ALTER TABLE customer ADD COLUMN lname TEXT GENERATED ALWAYS AS (
+        CASE WHEN instr(name, ' ') > 0 THEN substr(name, instr(name, ' ') + 1) END
+    ) VIRTUAL;
+    """
+
+def init_db():
+    conn = get_write_conn()
+    cur = conn.cursor()
+
+    # Already initialised at this schema version: skip DDL and seeding
+    cur.execute('PRAGMA user_version')
+    version = cur.fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+
+    cur.executescript(_SCHEMA_SQL)
+    # Generated columns need SQLite 3.31+; on older libraries the customer table
+    # goes without fname/lname rather than failing to start, and the file is only
+    # stamped as v1 so the columns get added once a newer library opens it
+    new_version = SCHEMA_VERSION
+    if sqlite3.sqlite_version_info >= (3, 31, 0):
+        customer_cols = {row[1] for row in cur.execute('PRAGMA table_xinfo(customer)')}
+        if 'fname' not in customer_cols:
+            cur.executescript(_CUSTOMER_NAME_SQL)
+    else:
+        new_version = 1
+
+    # Seed data and the version stamp go in one transaction, so first-run
+    # population costs a single commit. A failure here is fatal at startup and
+    # the uncommitted transaction is rolled back when the process exits.
+    cur.execute('BEGIN IMMEDIATE')
+
+    # probe every seeded table for emptiness in one statement; a database that
+    # was already initialised (and is only being upgraded) is never re-seeded
+    seeded = ('cuisine', 'employee', 'chef', 'ingredient', 'food', 'drink', 'delivery', 'customer')
+    if version == 0:
+        cur.execute('SELECT ' + ', '.join(f'NOT EXISTS (SELECT 1 FROM {t})' for t in seeded))
+        is_empty = dict(zip(seeded, cur.fetchone()))
+    else:
+        is_empty = dict.fromkeys(seeded, False)
+
     def empty(table):
-        cur.execute(f"SELECT COUNT(*) FROM {table}")
-        return cur.fetchone()[0] == 0
+        return is_empty[table]
 
     # populate sample data only if empty, and match schema
     if empty('cuisine'):
@@ -204,8 +329,8 @@ def init_db():
         ]
         cur.executemany('INSERT INTO customer (name,phone,address) VALUES (?,?,?)', sample_customers)
 
+    cur.execute(f'PRAGMA user_version = {new_version}')
     conn.commit()
-    conn.close()
 
 # --------------------------
 # GUI Application
@@ -216,11 +341,21 @@ class App:
         self.root = root
         self.root.title('Food Ordering App')
         self.root.geometry('1024x700')
-        self.cart = []  # (type, id, name, price, qty)
+        # cart stored column-wise: item i is (cart_types[i], cart_ids[i], cart_names[i], cart_prices[i], cart_qtys[i])
+        self.cart_types = []
+        self.cart_ids = []
+        self.cart_names = []
+        self.cart_prices = []
+        self.cart_qtys = []
+        self.cart_total = 0  # running sum of price*qty, kept in step with the cart lists
+        self.cart_first = {'food': None, 'drink': None}  # index of first item of each type
+        self.admin_request = 0  # bumped per show_table call so stale fetches are dropped
+        self.delivery_prompt = None  # cached checkout prompt, see get_delivery_prompt
 
         self.setup_style()
         self.create_widgets()
         self.load_menu()
+        self.get_delivery_prompt()
 
     def setup_style(self):
         style = ttk.Style(self.root)
@@ -287,25 +422,27 @@ class App:
         self.drink_tree.bind('<Double-1>', self.on_drink_add)
 
     def load_menu(self):
-        # clear
-        for tv in (self.food_tree, self.drink_tree):
-            for r in tv.get_children():
-                tv.delete(r)
-
-        conn = get_conn()
-        cur = conn.cursor()
-
-        cur.execute('SELECT foodid, foodname, price, quantity, foodavail FROM food')
-        for i, (fid, name, price, qty, avail) in enumerate(cur.fetchall(), start=1):
-            tag = 'even' if i%2==0 else 'odd'
-            self.food_tree.insert('', 'end', iid=f'food_{fid}', values=(name, f"{price}", qty, avail), tags=(tag,))
-
-        cur.execute('SELECT drinkid, drinkname, price, quantity, drinkavail FROM drink')
-        for i, (did, name, price, qty, avail) in enumerate(cur.fetchall(), start=1):
-            tag = 'even' if i%2==0 else 'odd'
-            self.drink_tree.insert('', 'end', iid=f'drink_{did}', values=(name, f"{price}", qty, avail), tags=(tag,))
-
-        conn.close()
+        cur = get_read_conn().cursor()
+        for tv, sql, prefix in ((self.food_tree, SQL_LOAD_FOOD, 'food_'), (self.drink_tree, SQL_LOAD_DRINK, 'drink_')):
+            cur.execute(sql)
+            # build every (iid, values, tag) up front; the row tag is a plain lookup
+            rows = [(prefix + str(_id), (name, price, qty, avail), ROW_TAGS[i & 1])
+                    for i, (_id, name, price, qty, avail) in enumerate(cur.fetchall(), start=1)]
+            self.sync_tree(tv, rows)
+
+    def sync_tree(self, tv, rows):
+        # Update existing rows in place (keyed by iid) instead of clearing and
+        # re-inserting everything; only new rows are inserted, missing ones deleted.
+        wanted = {iid for iid, _values, _tag in rows}
+        existing = set(tv.get_children())
+        stale = [iid for iid in existing if iid not in wanted]
+        if stale:
+            tv.delete(*stale)
+        for pos, (iid, values, tag) in enumerate(rows):
+            if iid in existing:
+                tv.item(iid, values=values, tags=(tag,))
+            else:
+                tv.insert('', pos, iid=iid, values=values, tags=(tag,))
 
     def on_food_add(self, event):
         iid = self.food_tree.focus()
@@ -325,7 +462,7 @@ class App:
             max_q = 50
         q = simpledialog.askinteger('Quantity', f'Quantity for {name} (available {qty_avail})', minvalue=1, maxvalue=max_q)
         if q:
-            self.cart.append(('food', fid, name, float(price), int(q)))
+            self.add_to_cart('food', fid, name, float(price), int(q))
             messagebox.showinfo('Added', f'Added {q} x {name} to cart')
             self.update_cart_view()
 
@@ -343,10 +480,20 @@ class App:
         name, price, qty_avail, avail = vals
         q = simpledialog.askinteger('Quantity', f'Quantity for {name}', minvalue=1, maxvalue=20)
         if q:
-            self.cart.append(('drink', did, name, float(price), int(q)))
+            self.add_to_cart('drink', did, name, float(price), int(q))
             messagebox.showinfo('Added', f'Added {q} x {name} to cart')
             self.update_cart_view()
 
+    def add_to_cart(self, typ, _id, name, price, qty):
+        if self.cart_first[typ] is None:
+            self.cart_first[typ] = len(self.cart_types)
+        self.cart_types.append(typ)
+        self.cart_ids.append(_id)
+        self.cart_names.append(name)
+        self.cart_prices.append(price)
+        self.cart_qtys.append(qty)
+        self.cart_total += price * qty
+
     # ------------------ Cart Tab ------------------
     def build_cart_tab(self):
         f = self.tab_cart
@@ -374,16 +521,11 @@ class App:
     def update_cart_view(self):
         for r in self.cart_tree.get_children():
             self.cart_tree.delete(r)
-        total = 0
-        for idx, item in enumerate(self.cart, start=1):
-            if len(item) != 5:
-                continue
-            typ, _id, name, price, qty = item
+        items = zip(self.cart_types, self.cart_names, self.cart_prices, self.cart_qtys)
+        for idx, (typ, name, price, qty) in enumerate(items, start=1):
             subtotal = price * qty
-            total += subtotal
-            tag = 'even' if idx%2==0 else 'odd'
-            self.cart_tree.insert('', 'end', iid=str(idx), values=(typ.capitalize(), name, f"{price}", qty, f"{subtotal}"), tags=(tag,))
-        self.total_var.set(f'Total: Rs {total}')
+            self.cart_tree.insert('', 'end', iid=str(idx), values=(typ.capitalize(), name, f"{price}", qty, f"{subtotal}"), tags=(ROW_TAGS[idx & 1],))
+        self.total_var.set(f'Total: Rs {self.cart_total}')
 
     def remove_selected_cart(self):
         sel = self.cart_tree.selection()
@@ -394,30 +536,47 @@ class App:
         except Exception:
             messagebox.showwarning('Remove', 'Could not determine selected item.')
             return
-        if 0 <= idx < len(self.cart):
-            removed = self.cart.pop(idx)
-            messagebox.showinfo('Removed', f'Removed {removed[2]} from cart')
+        if 0 <= idx < len(self.cart_types):
+            self.cart_types.pop(idx)
+            self.cart_ids.pop(idx)
+            name = self.cart_names.pop(idx)
+            price = self.cart_prices.pop(idx)
+            qty = self.cart_qtys.pop(idx)
+            self.cart_total = self.cart_total - price * qty if self.cart_types else 0
+            for t, first in self.cart_first.items():
+                if first is None or first < idx:
+                    continue
+                if first > idx:
+                    self.cart_first[t] = first - 1
+                else:
+                    # removed the tracked item: nothing before idx has this type,
+                    # so look for the next one from idx onwards
+                    self.cart_first[t] = next((i for i in range(idx, len(self.cart_types)) if self.cart_types[i]==t), None)
+            messagebox.showinfo('Removed', f'Removed {name} from cart')
             self.update_cart_view()
 
     def clear_cart(self):
-        self.cart = []
+        for col in (self.cart_types, self.cart_ids, self.cart_names, self.cart_prices, self.cart_qtys):
+            col.clear()
+        self.cart_total = 0
+        self.cart_first = {'food': None, 'drink': None}
         self.update_cart_view()
 
     # ------------------ Checkout / Orders ------------------
     def place_order_flow(self):
-        if not self.cart:
+        if not self.cart_types:
             messagebox.showwarning('Empty', 'Cart is empty')
             return
 
-        conn = get_conn()
+        conn = get_write_conn()
         cur = conn.cursor()
+        reader = get_read_conn()
 
         # Ask for customer id or create new
         custid = simpledialog.askinteger('Customer ID', 'Enter customer ID (leave blank to create new):', minvalue=1)
         if not custid:
             create = messagebox.askyesno('New customer', 'Create a new customer now?')
             if not create:
-                conn.close()
                 return
             fname = simpledialog.askstring('First name', 'First name:')
             lname = simpledialog.askstring('Last name', 'Last name:')
@@ -425,71 +584,72 @@ class App:
             address = simpledialog.askstring('Address', 'Address:')
             if not (fname and lname and phone and address):
                 messagebox.showerror('Error', 'All fields required to create customer.')
-                conn.close()
                 return
             full_name = f"{fname} {lname}"
-            cur.execute('INSERT INTO customer (name, phone, address) VALUES (?,?,?)', (full_name, phone, address))
-            conn.commit()
+            cur.execute(SQL_INSERT_CUSTOMER, (full_name, phone, address))
             custid = cur.lastrowid
             messagebox.showinfo('Customer Created', f'New customer ID: {custid}')
         else:
-            cur.execute('SELECT COUNT(*) FROM customer WHERE custid=?', (custid,))
-            if cur.fetchone()[0] == 0:
+            if reader.execute(SQL_CUSTOMER_EXISTS, (custid,)).fetchone()[0] == 0:
                 messagebox.showerror('Not found', 'Customer ID not found.')
-                conn.close()
                 return
 
         # Delivery selection (optional)
-        cur.execute('SELECT delid, delname, delcharge FROM delivery')
-        deliveries = cur.fetchall()
+        prompt = self.get_delivery_prompt()
         delid = None
-        if deliveries:
-            options = [f'{d[0]}: {d[1]} (Rs {d[2]})' for d in deliveries]
-            choice = simpledialog.askinteger('Delivery', 'Choose delivery id:\n' + '\n'.join(options), minvalue=1)
+        if prompt:
+            choice = simpledialog.askinteger('Delivery', prompt, minvalue=1)
             if choice is None:
-                conn.close()
                 return
             delid = choice
 
         # Compute total
-        total_cost = sum(item[3] * item[4] for item in self.cart)
+        total_cost = self.cart_total
 
         # For simplified orders table, store first food/drink ids if present
-        first_food = next((it for it in self.cart if it[0]=='food'), None)
-        first_drink = next((it for it in self.cart if it[0]=='drink'), None)
-        foodid = first_food[1] if first_food else None
-        drinkid = first_drink[1] if first_drink else None
-
-        # Insert into orders
-        cur.execute('INSERT INTO orders (totalcost, foodid, drinkid, delid) VALUES (?,?,?,?)',
-                    (int(total_cost), foodid, drinkid, delid))
-        ordid = cur.lastrowid
+        first_food = self.cart_first['food']
+        first_drink = self.cart_first['drink']
+        foodid = self.cart_ids[first_food] if first_food is not None else None
+        drinkid = self.cart_ids[first_drink] if first_drink is not None else None
 
-        # Payment
+        # Payment (asked up front so no dialog is open while the write lock is held)
         paymethod = simpledialog.askstring('Payment', 'Payment method (Cash/Credit Card/PayPal):') or 'Cash'
-        cur.execute('INSERT INTO payment (paymethod, custid, ordid) VALUES (?,?,?)', (paymethod, custid, ordid))
-
-        # Update stock quantities for foods
-        for it in self.cart:
-            typ, _id, _name, price, qty = it
-            if typ == 'food' and _id is not None:
-                cur.execute('SELECT quantity FROM food WHERE foodid=?', (_id,))
-                row = cur.fetchone()
-                if row:
-                    current = row[0] if row[0] is not None else 0
-                    new_qty = current - qty
-                    if new_qty < 0:
-                        new_qty = 0
-                    cur.execute('UPDATE food SET quantity=? WHERE foodid=?', (new_qty, _id))
-
-        conn.commit()
-        conn.close()
+
+        food_updates = [(qty, _id) for typ, _id, qty in zip(self.cart_types, self.cart_ids, self.cart_qtys)
+                        if typ == 'food' and _id is not None]
+
+        try:
+            cur.execute('BEGIN IMMEDIATE')
+
+            # Insert into orders
+            cur.execute(SQL_INSERT_ORDER, (int(total_cost), foodid, drinkid, delid))
+            ordid = cur.lastrowid
+
+            cur.execute(SQL_INSERT_PAYMENT, (paymethod, custid, ordid))
+
+            # Update stock quantities for foods (clamped at 0, NULL counts as 0)
+            cur.executemany(SQL_UPDATE_STOCK, food_updates)
+
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            messagebox.showerror('Error', str(e))
+            return
 
         messagebox.showinfo('Order Placed', f'Order {ordid} placed. Total: Rs {total_cost}')
-        self.cart = []
-        self.update_cart_view()
+        self.clear_cart()
         self.load_menu()
 
+    def get_delivery_prompt(self):
+        # The delivery table rarely changes, so build the checkout prompt once and
+        # reuse it; anything that modifies delivery rows resets delivery_prompt.
+        # An empty string means there are no delivery options.
+        if self.delivery_prompt is None:
+            deliveries = get_read_conn().execute(SQL_LOAD_DELIVERY).fetchall()
+            options = [f'{d[0]}: {d[1]} (Rs {d[2]})' for d in deliveries]
+            self.delivery_prompt = 'Choose delivery id:\n' + '\n'.join(options) if options else ''
+        return self.delivery_prompt
+
     # ------------------ Admin Tab ------------------
     def build_admin_tab(self):
         f = self.tab_admin
@@ -501,6 +661,7 @@ class App:
         ttk.Button(btns, text='View Drink', command=lambda: self.show_table('drink')).pack(side='left', padx=4)
         ttk.Button(btns, text='View Orders', command=lambda: self.show_table('orders')).pack(side='left', padx=4)
         ttk.Button(btns, text='View Payments', command=lambda: self.show_table('payment')).pack(side='left', padx=4)
+        ttk.Button(btns, text='View Menu Details', command=lambda: self.show_table('menu_food_v')).pack(side='left', padx=4)
         ttk.Button(btns, text='Reset All Customers', command=self.reset_customers).pack(side='right', padx=4)
         ttk.Button(btns, text='Add Food Item', command=self.add_food_window).pack(side='right', padx=4)
 
@@ -510,31 +671,64 @@ class App:
     def show_table(self, table_name):
         for w in self.admin_frame.winfo_children():
             w.destroy()
-        conn = get_conn()
-        try:
-            df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
-        except Exception as e:
-            messagebox.showerror('Error', str(e))
-            conn.close()
+        sql = SQL_ADMIN_TABLES.get(table_name)
+        if sql is None:
+            messagebox.showerror('Error', f'Unknown table: {table_name}')
+            return
+        ttk.Label(self.admin_frame, text=f'Loading {table_name}...').pack(anchor='w')
+        self.admin_request += 1
+        request = self.admin_request
+
+        # Run the query on a worker thread with its own read-only connection
+        # (WAL lets it read alongside the writer) and hand the rows back to Tk
+        # via after()
+        def fetch():
+            conn = None
+            try:
+                conn = open_read_conn()
+                cur = conn.execute(sql)
+                cols = [d[0] for d in cur.description]
+                rows = cur.fetchall()
+            except Exception as e:
+                deliver(request, None, None, str(e))
+                return
+            finally:
+                if conn is not None:
+                    conn.close()
+            deliver(request, cols, rows)
+
+        def deliver(*args):
+            try:
+                self.root.after(0, self.fill_admin_table, *args)
+            except (RuntimeError, tk.TclError):
+                pass  # window was closed while loading; nothing left to fill
+
+        threading.Thread(target=fetch, daemon=True).start()
+
+    def fill_admin_table(self, request, cols, rows, error=None):
+        if request != self.admin_request:
+            return  # a newer table was requested while this one was loading
+        for w in self.admin_frame.winfo_children():
+            w.destroy()
+        if error is not None:
+            messagebox.showerror('Error', error)
             return
-        conn.close()
 
-        tv = ttk.Treeview(self.admin_frame, columns=list(df.columns), show='headings')
-        for c in df.columns:
+        tv = ttk.Treeview(self.admin_frame, columns=cols, show='headings')
+        for c in cols:
             tv.heading(c, text=c)
             tv.column(c, width=120, anchor='center')
-        for _, row in df.iterrows():
-            tv.insert('', 'end', values=list(row.values))
+        for row in rows:
+            tv.insert('', 'end', values=row)
         tv.pack(fill='both', expand=True)
 
     def reset_customers(self):
         if not messagebox.askyesno('Confirm', 'This will DELETE all customers permanently. Continue?'):
             return
-        conn = get_conn()
+        conn = get_write_conn()
         cur = conn.cursor()
         cur.execute('DELETE FROM customer')
-        conn.commit()
-        conn.close()
+        self.delivery_prompt = None  # deliveries tied to a customer cascade away with it
         messagebox.showinfo('Done', 'All customers deleted.')
 
     def add_food_window(self):
@@ -551,7 +745,7 @@ class App:
         def add_food():
             vals = [entries[l].get() or None for l in labels]
             try:
-                conn = get_conn(); cur = conn.cursor()
+                conn = get_write_conn(); cur = conn.cursor()
                 cleaned = []
                 for idx, v in enumerate(vals):
                     if v in (None, '', 'None'):
@@ -564,9 +758,15 @@ class App:
                                 cleaned.append(None)
                         else:
                             cleaned.append(v)
-                cur.execute('INSERT INTO food (foodid,foodname,price,quantity,foodavail,cuisineid,ingid,chefid) VALUES (?,?,?,?,?,?,?,?)', cleaned)
-                conn.commit(); conn.close()
-                messagebox.showinfo('Added', 'Food added successfully.')
+                # the customer menu only lists 'Available' items, so default a blank field to that
+                avail_idx = labels.index('foodavail')
+                if cleaned[avail_idx] is None:
+                    cleaned[avail_idx] = 'Available'
+                cur.execute(SQL_INSERT_FOOD, cleaned)
+                if cleaned[avail_idx] == 'Available':
+                    messagebox.showinfo('Added', 'Food added successfully.')
+                else:
+                    messagebox.showinfo('Added', f"Food added successfully. It is hidden from the menu until foodavail is 'Available' (got '{cleaned[avail_idx]}').")
                 top.destroy()
                 self.load_menu()
             except Exception as e:
@@ -581,4 +781,10 @@ if __name__ == '__main__':
     init_db()
     root = tk.Tk()
     app = App(root)
+
+    def on_close():
+        close_conn()
+        root.destroy()
+
+    root.protocol('WM_DELETE_WINDOW', on_close)
     root.mainloop()